@@ -6,10 +6,10 @@ Optimized for short utterances with sub-second processing.
 
 import sys
 import os
+import math
 import time
 import signal
-import wave
-import tempfile
+import importlib.util
 import subprocess
 import threading
 import argparse
@@ -17,150 +17,395 @@ import argparse
 try:
     import pyaudio
     import numpy as np
-    from pywhispercpp.model import Model
 except ImportError as e:
     print(f"Missing dependency: {e}")
     sys.exit(1)
 
+# Optional: python-xlib lets us paste via XTest without forking xdotool
+try:
+    from Xlib import X, XK, display as xdisplay
+    from Xlib.ext import xtest
+except ImportError:
+    xdisplay = None
+
+# Optional: jeepney talks to the notification daemon without forking notify-send
+try:
+    from jeepney import DBusAddress, new_method_call, unwrap_msg
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    open_dbus_connection = None
+
+# Audio capture settings
+CHUNK = 1024
+FORMAT = pyaudio.paInt16
+CHANNELS = 1
+RATE = 16000
+
+
+def aligned_empty(n, dtype, align=64):
+    """Uninitialized C-contiguous array whose data starts on an `align`-byte boundary."""
+    nbytes = n * np.dtype(dtype).itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -raw.ctypes.data % align
+    return raw[offset:offset + nbytes].view(dtype)
+
+
+def physical_core_count():
+    """Number of physical CPU cores (hyperthread siblings counted once)."""
+    cores = set()
+    try:
+        with open("/proc/cpuinfo") as f:
+            physical_id = core_id = None
+            for line in f:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key == "physical id":
+                    physical_id = value.strip()
+                elif key == "core id":
+                    core_id = value.strip()
+                elif not line.strip():
+                    # Blank line ends one logical CPU's block
+                    if core_id is not None:
+                        cores.add((physical_id, core_id))
+                    physical_id = core_id = None
+            if core_id is not None:
+                cores.add((physical_id, core_id))
+    except OSError:
+        pass
+    return len(cores) or os.cpu_count() or 4
+
+
+def chunk_rms(chunk):
+    """RMS level of an int16 chunk."""
+    return np.sqrt(np.mean(chunk.astype(np.int32) ** 2))
+
+
+def _chunk_rms_loop(chunk):
+    """RMS level of an int16 chunk, written as a loop for numba."""
+    acc = 0.0
+    for i in range(chunk.shape[0]):
+        v = float(chunk[i])
+        acc += v * v
+    return math.sqrt(acc / chunk.shape[0])
+
+
+def compile_chunk_rms():
+    """Return a numba-compiled chunk_rms ready for callback use, or None.
+    
+    Optional: numba turns the per-chunk VAD energy loop into native code.
+    Importing numba is slow, so call this off the main thread.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    kernel = njit(cache=True, fastmath=True)(_chunk_rms_loop)
+    # PyAudio chunks arrive as read-only frombuffer views; numba specializes
+    # on that, so warm exactly this signature
+    kernel(np.frombuffer(bytes(2 * CHUNK), dtype=np.int16))
+    return kernel
+
 
 class FastRecorder:
-    def __init__(self):
-        self.recording = True
-        self.frames = []
+    def __init__(self, auto_stop=None):
+        # Start loading the model before anything else so it overlaps with
+        # PortAudio setup and recording
+        self.model = None
+        self._model_ready = threading.Event()
+        self._model_thread = threading.Thread(target=self._load_model, daemon=True)
+        self._model_thread.start()
+        
+        # Seconds of trailing silence that end recording (None: toggle only)
+        self.auto_stop = auto_stop
+        
+        # pywhispercpp is imported lazily in the loader thread; fail fast
+        # here rather than after the user has recorded an utterance
+        if importlib.util.find_spec("pywhispercpp") is None:
+            print("Missing dependency: pywhispercpp", flush=True)
+            sys.exit(1)
+        
         self.audio = pyaudio.PyAudio()
         self.stream = None
-        self.model = None
-        self.should_stop = False
+        self._stop = threading.Event()
+        self._stop_requested = False
+        self._buf = None
+        self._audio_f32 = None
+        self._chunk_rms = chunk_rms
         
-        # Preload whisper.cpp model (tiny for speed)
-        print("Loading Whisper.cpp model...", flush=True)
+        # Open the audio stream once, paused; record() only starts/stops it
         try:
-            # Use tiny model for fastest processing
-            self.model = Model('tiny', n_threads=4)
-            print("Model ready!", flush=True)
+            self.stream = self.audio.open(
+                format=FORMAT,
+                channels=CHANNELS,
+                rate=RATE,
+                input=True,
+                input_device_index=10,
+                frames_per_buffer=CHUNK,
+                stream_callback=self._audio_callback,
+                start=False
+            )
         except Exception as e:
-            print(f"Failed to load model: {e}", flush=True)
-            # Fall back to base if tiny fails
+            print(f"Failed to open audio stream: {e}", flush=True)
+        
+        # Compile the optional numba VAD kernel off the main thread
+        threading.Thread(target=self._load_vad_kernel, daemon=True).start()
+        
+        # Detect if we're on Wayland
+        self.is_wayland = os.environ.get('WAYLAND_DISPLAY') is not None
+        
+        # Keep one D-Bus connection for notifications
+        self.dbus = None
+        if open_dbus_connection:
             try:
-                self.model = Model('base', n_threads=4)
-                print("Using base model", flush=True)
-            except:
-                print("Could not load any model", flush=True)
-                sys.exit(1)
+                self.dbus = open_dbus_connection(bus='SESSION')
+                self.notifications = DBusAddress(
+                    '/org/freedesktop/Notifications',
+                    bus_name='org.freedesktop.Notifications',
+                    interface='org.freedesktop.Notifications'
+                )
+            except Exception as e:
+                print(f"D-Bus connection failed: {e}", flush=True)
+        
+        # Keep one X11 connection for auto-paste (X11 only)
+        self.x_display = None
+        if xdisplay and os.environ.get('DISPLAY') and not self.is_wayland:
+            try:
+                self.x_display = xdisplay.Display()
+            except Exception as e:
+                print(f"X11 connection failed: {e}", flush=True)
         
         # Signal handler
         signal.signal(signal.SIGTERM, self.handle_stop)
         signal.signal(signal.SIGINT, self.handle_stop)
     
+    def _load_vad_kernel(self):
+        """Swap in the numba VAD kernel once it is compiled and warmed up."""
+        try:
+            kernel = compile_chunk_rms()
+        except Exception as e:
+            print(f"VAD kernel compile failed: {e}", flush=True)
+            return
+        # The callback keeps using the NumPy version until this point, so
+        # compilation never happens inside the audio callback
+        if kernel is not None:
+            self._chunk_rms = kernel
+    
+    def _load_model(self):
+        """Load and warm up the whisper.cpp model (runs in a background thread)."""
+        try:
+            # Preload whisper.cpp model (quantized English-only tiny for speed);
+            # imported here so its shared library loads off the main thread
+            print("Loading Whisper.cpp model...", flush=True)
+            try:
+                from pywhispercpp.model import Model
+            except ImportError as e:
+                print(f"Missing dependency: {e}", flush=True)
+                return
+            
+            models_dir = os.path.expanduser("~/.cache/whisper")
+            # Greedy single-candidate decoding in one segment: short utterances
+            # don't benefit from multiple candidates or cross-segment context
+            params = dict(
+                n_threads=physical_core_count(),
+                language='en',
+                translate=False,
+                params_sampling_strategy=0,
+                greedy={'best_of': 1},
+                temperature=0.0,
+                no_context=True,
+                single_segment=True,
+            )
+            try:
+                # q5_1 weights halve memory traffic in the encoder matmuls
+                self.model = Model('tiny.en-q5_1', models_dir=models_dir, **params)
+                print("Model ready!", flush=True)
+            except Exception as e:
+                print(f"Failed to load model: {e}", flush=True)
+                # Fall back to base if tiny fails
+                try:
+                    self.model = Model('base.en-q5_1', models_dir=models_dir, **params)
+                    print("Using base model", flush=True)
+                except:
+                    print("Could not load any model", flush=True)
+                    return
+            
+            # Warm up: one second of silence allocates the mel and KV buffers
+            try:
+                self.model.transcribe(np.zeros(16000, dtype=np.float32))
+            except Exception as e:
+                print(f"Model warm-up failed: {e}", flush=True)
+        finally:
+            self._model_ready.set()
+    
     def handle_stop(self, signum, frame):
-        """Handle stop signal - set flag to stop recording."""
+        """Handle stop signal - wake the recording wait."""
         print(f"\nStop signal received (signal {signum})", flush=True)
-        self.should_stop = True
-        self.recording = False
+        self._stop_requested = True
+        # Handlers run on the main thread, which may be inside Event.wait()
+        # holding the event's non-reentrant lock; set it from another thread
+        threading.Thread(target=self._stop.set, daemon=True).start()
     
     def notify(self, message):
         """Send notification."""
+        if self.dbus:
+            try:
+                msg = new_method_call(
+                    self.notifications, 'Notify', 'susssasa{sv}i',
+                    ('LinuxST', 0, '', 'LinuxST', message, [], {}, 2000)
+                )
+                unwrap_msg(self.dbus.send_and_get_reply(msg, timeout=1))
+                return
+            except Exception:
+                pass
+        
         try:
             subprocess.run(
                 ["notify-send", "LinuxST", message, "-t", "2000"],
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
         except:
             pass
     
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PyAudio callback - copy incoming samples into the record buffer."""
+        chunk_np = np.frombuffer(in_data, dtype=np.int16)
+        n = min(len(chunk_np), len(self._buf) - self._off)
+        self._buf[self._off:self._off + n] = chunk_np[:n]
+        self._off += n
+        
+        # Energy-based VAD: find where speech starts and, with auto-stop
+        # enabled, stop once speech is followed by enough silence
+        rms = self._chunk_rms(chunk_np)
+        if rms > self._vad_threshold:
+            self._voiced += n
+            # Speech starts only after a run of voiced chunks, so a lone
+            # transient (e.g. a key click) can't trim away the recording;
+            # keep a pre-roll so soft word onsets survive
+            if self._speech_start is None and self._voiced >= self._min_voiced_samples:
+                self._speech_start = max(0, self._off - self._voiced - self._preroll_samples)
+            self._silent = 0
+        else:
+            self._voiced = 0
+            if self._speech_start is not None and self._silence_samples:
+                self._silent += n
+                if self._silent >= self._silence_samples:
+                    self._vad_stopped = True
+                    self._stop.set()
+                    return (None, pyaudio.paComplete)
+        
+        # Simple progress indicator, one dot per 2 seconds of audio
+        if self._off >= self._next_dot:
+            sys.stdout.write(".")
+            sys.stdout.flush()
+            self._next_dot += self._dot_samples
+        
+        if self._off >= len(self._buf):
+            self._stop.set()
+            return (None, pyaudio.paComplete)
+        return (None, pyaudio.paContinue)
+    
     def record(self, max_duration=60):
         """Record audio until stopped."""
-        CHUNK = 1024
-        FORMAT = pyaudio.paInt16
-        CHANNELS = 1
-        RATE = 16000
+        VAD_THRESHOLD = 500     # int16 RMS level treated as speech
+        VAD_MIN_VOICED = 0.15   # seconds of consecutive voiced audio that start speech
+        VAD_PREROLL = 0.3       # seconds kept before detected speech
+        
+        if self.stream is None:
+            print("No audio stream available", flush=True)
+            return None
         
         try:
-            # Open audio stream
-            self.stream = self.audio.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                input=True,
-                input_device_index=10,
-                frames_per_buffer=CHUNK
-            )
+            # Preallocated sample buffers, reused across recordings;
+            # the int16 one is filled by the stream callback
+            n_samples = max_duration * RATE
+            if self._buf is None or len(self._buf) != n_samples:
+                self._buf = np.empty(n_samples, dtype=np.int16)
+                # Cache-line aligned for the SIMD loops that read it; the
+                # no-copy hand-off to whisper.cpp comes from passing a
+                # C-contiguous float32 slice
+                self._audio_f32 = aligned_empty(n_samples, np.float32)
+            self._off = 0
+            self._dot_samples = 2 * RATE
+            self._next_dot = self._dot_samples
+            self._vad_threshold = VAD_THRESHOLD
+            self._min_voiced_samples = int(VAD_MIN_VOICED * RATE)
+            self._preroll_samples = int(VAD_PREROLL * RATE)
+            self._voiced = 0
+            self._silence_samples = int(self.auto_stop * RATE) if self.auto_stop else 0
+            self._speech_start = None
+            self._silent = 0
+            self._vad_stopped = False
+            
+            # Reset the stop event for this recording, keeping a stop signal
+            # that arrived before recording started
+            self._stop.clear()
+            if self._stop_requested:
+                self._stop.set()
+            
+            # Start the pre-opened stream; PortAudio pushes buffers into the callback
+            self.stream.start_stream()
             
             print("Recording started - speak now!", flush=True)
             self.notify("Recording")
             
             start_time = time.time()
             
-            # Recording loop
-            while self.recording and not self.should_stop:
-                elapsed = time.time() - start_time
-                
-                if elapsed >= max_duration:
-                    print(f"\nMax duration reached ({max_duration}s)", flush=True)
-                    break
-                
-                try:
-                    data = self.stream.read(CHUNK, exception_on_overflow=False)
-                    self.frames.append(data)
-                    
-                    # Simple progress indicator
-                    if int(elapsed) % 2 == 0:
-                        sys.stdout.write(".")
-                        sys.stdout.flush()
-                        
-                except:
-                    break
+            # Sleep until a stop signal, trailing silence or a full buffer
+            # sets the event, or the duration limit passes
+            stopped = self._stop.wait(timeout=max_duration)
+            self._stop_requested = False
+            if not stopped:
+                print(f"\nMax duration reached ({max_duration}s)", flush=True)
+            elif self._vad_stopped:
+                print(f"\nSilence detected ({self.auto_stop}s)", flush=True)
+            elif self._off >= len(self._buf):
+                print(f"\nBuffer full ({max_duration}s)", flush=True)
             
             print(f"\nRecording stopped after {time.time() - start_time:.1f}s", flush=True)
             
-            # Stop and close stream
+            # Pause the stream; it stays open for the next recording
             self.stream.stop_stream()
-            self.stream.close()
             
-            # Save audio
-            if len(self.frames) > 5:
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-                    filename = f.name
+            # Convert PCM16 to float32 in memory for whisper.cpp
+            # Trim leading silence so the encoder only sees the utterance
+            begin = self._speech_start or 0
+            if self._off - begin > 5 * CHUNK:
+                # Fused cast + scale in one ufunc pass into the float32 buffer
+                audio = self._audio_f32[:self._off - begin]
+                np.multiply(self._buf[begin:self._off], np.float32(1.0 / 32768.0),
+                            out=audio, dtype=np.float32, casting='unsafe')
                 
-                with wave.open(filename, 'wb') as wf:
-                    wf.setnchannels(CHANNELS)
-                    wf.setsampwidth(self.audio.get_sample_size(FORMAT))
-                    wf.setframerate(RATE)
-                    wf.writeframes(b''.join(self.frames))
-                
-                print(f"Audio saved: {filename}", flush=True)
-                return filename
+                print(f"Audio captured: {len(audio) / RATE:.1f}s", flush=True)
+                return audio
                 
         except Exception as e:
             print(f"Recording error: {e}", flush=True)
             return None
     
-    def transcribe(self, audio_file):
-        """Transcribe the audio file using whisper.cpp."""
+    def transcribe(self, audio):
+        """Transcribe the float32 audio samples using whisper.cpp."""
         try:
             print("Starting transcription...", flush=True)
             self.notify("Transcribing")
             
+            # Wait for the background model load to finish
+            self._model_ready.wait()
+            if self.model is None:
+                print("No model available", flush=True)
+                return None
+            
             start_time = time.time()
             
             # Transcribe with whisper.cpp
-            segments = self.model.transcribe(audio_file, language='en')
+            segments = self.model.transcribe(audio)
             
             # Combine all segments
-            text = ""
-            for segment in segments:
-                text += segment.text + " "
-            text = text.strip()
+            text = " ".join(segment.text for segment in segments).strip()
             
             transcription_time = time.time() - start_time
             print(f"Transcription took {transcription_time:.2f}s", flush=True)
             
-            # Clean up
-            try:
-                os.unlink(audio_file)
-            except:
-                pass
-            
             if text and text != "[BLANK_AUDIO]":
                 print(f"Transcription: '{text}'", flush=True)
                 return text
@@ -172,57 +417,74 @@ class FastRecorder:
             print(f"Transcription error: {e}", flush=True)
             return None
     
-    def copy_and_paste(self, text):
-        """Copy to clipboard and paste."""
-        print(f"Copying text: '{text[:50]}...'", flush=True)
-        
-        # First, save to file immediately
-        try:
-            with open("/tmp/linuxst_last_transcription.txt", "w") as f:
-                f.write(text)
-            print("Saved to /tmp/linuxst_last_transcription.txt", flush=True)
-        except Exception as e:
-            print(f"Failed to save file: {e}", flush=True)
-        
-        # Detect if we're on Wayland
-        is_wayland = os.environ.get('WAYLAND_DISPLAY') is not None
-        print(f"Display server: {'Wayland' if is_wayland else 'X11'}", flush=True)
-        
-        # Copy to clipboard
-        clipboard_copied = False
-        
-        # Try simple echo pipe to wl-copy first
+    def _copy_wl_copy(self, text):
+        """Copy text to the clipboard with wl-copy (Wayland)."""
         try:
             result = subprocess.run(
                 ["wl-copy"],
                 input=text.encode(),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=1
             )
             if result.returncode == 0:
-                clipboard_copied = True
                 print("Copied to clipboard via wl-copy", flush=True)
-            else:
-                print(f"wl-copy failed with code {result.returncode}", flush=True)
+                return True
+            print(f"wl-copy failed with code {result.returncode}", flush=True)
         except subprocess.TimeoutExpired:
             print("wl-copy timeout", flush=True)
         except FileNotFoundError:
             print("wl-copy not found", flush=True)
         except Exception as e:
             print(f"wl-copy error: {e}", flush=True)
+        return False
+    
+    def _copy_xclip(self, text):
+        """Copy text to the clipboard with xclip (X11)."""
+        try:
+            result = subprocess.run(["xclip", "-selection", "clipboard"], 
+                                  input=text.encode(), stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL, timeout=1)
+            if result.returncode == 0:
+                print("Copied via xclip (X11)", flush=True)
+                return True
+        except FileNotFoundError:
+            print("xclip not found", flush=True)
+        except Exception as e:
+            print(f"xclip error: {e}", flush=True)
+        return False
+    
+    def _xtest_paste(self):
+        """Send Ctrl+V through the XTest extension on the open X11 connection."""
+        d = self.x_display
+        ctrl = d.keysym_to_keycode(XK.string_to_keysym('Control_L'))
+        v = d.keysym_to_keycode(XK.string_to_keysym('v'))
+        xtest.fake_input(d, X.KeyPress, ctrl)
+        xtest.fake_input(d, X.KeyPress, v)
+        xtest.fake_input(d, X.KeyRelease, v)
+        xtest.fake_input(d, X.KeyRelease, ctrl)
+        d.sync()
+    
+    def copy_and_paste(self, text):
+        """Copy to clipboard and paste."""
+        print(f"Copying text: '{text[:50]}...'", flush=True)
         
-        # Try xclip as fallback
-        if not clipboard_copied:
-            try:
-                result = subprocess.run(["xclip", "-selection", "clipboard"], 
-                                      input=text.encode(), capture_output=True, timeout=1)
-                if result.returncode == 0:
-                    clipboard_copied = True
-                    print("Copied via xclip (X11)", flush=True)
-            except FileNotFoundError:
-                print("xclip not found", flush=True)
-            except Exception as e:
-                print(f"xclip error: {e}", flush=True)
+        # First, save to file immediately
+        try:
+            with open("/tmp/linuxst_last_transcription.txt", "w") as f:
+                f.write(text)
+            print("Saved to /tmp/linuxst_last_transcription.txt", flush=True)
+        except Exception as e:
+            print(f"Failed to save file: {e}", flush=True)
+        
+        print(f"Display server: {'Wayland' if self.is_wayland else 'X11'}", flush=True)
+        
+        # Copy to clipboard, trying the native tool for this display server first
+        # (the clipboard must outlive this process, so a helper process owns it)
+        if self.is_wayland:
+            clipboard_copied = self._copy_wl_copy(text) or self._copy_xclip(text)
+        else:
+            clipboard_copied = self._copy_xclip(text) or self._copy_wl_copy(text)
         
         if clipboard_copied:
             print("Clipboard copy successful", flush=True)
@@ -233,19 +495,30 @@ class FastRecorder:
         # The text is already saved to file and clipboard (when possible)
         paste_success = False
         
-        if not is_wayland:
+        if not self.is_wayland:
             # Only attempt auto-paste on X11
             time.sleep(0.5)
-            try:
-                result = subprocess.run(["xdotool", "key", "ctrl+v"], 
-                                      capture_output=True, timeout=1)
-                if result.returncode == 0:
+            if self.x_display:
+                try:
+                    self._xtest_paste()
                     paste_success = True
-                    print("Auto-pasted with xdotool", flush=True)
-                else:
-                    print(f"xdotool paste failed: {result.returncode}", flush=True)
-            except Exception as e:
-                print(f"Auto-paste error: {e}", flush=True)
+                    print("Auto-pasted with XTest", flush=True)
+                except Exception as e:
+                    print(f"XTest paste error: {e}", flush=True)
+            
+            # Fall back to xdotool if python-xlib is unavailable or failed
+            if not paste_success:
+                try:
+                    result = subprocess.run(["xdotool", "key", "ctrl+v"], 
+                                          stdout=subprocess.DEVNULL,
+                                          stderr=subprocess.DEVNULL, timeout=1)
+                    if result.returncode == 0:
+                        paste_success = True
+                        print("Auto-pasted with xdotool", flush=True)
+                    else:
+                        print(f"xdotool paste failed: {result.returncode}", flush=True)
+                except Exception as e:
+                    print(f"Auto-paste error: {e}", flush=True)
         
         # Notify user
         if paste_success:
@@ -260,20 +533,29 @@ class FastRecorder:
         """Main flow."""
         print("Starting recording flow...", flush=True)
         
+        # Don't make the user speak if the model already failed to load
+        if self._model_ready.is_set() and self.model is None:
+            print("No model available", flush=True)
+            self.notify("Model unavailable")
+            return
+        
         # Record
-        audio_file = self.record(60)
+        audio = self.record(60)
         
-        if not audio_file:
+        if audio is None:
             print("No audio recorded", flush=True)
             return
         
         # Transcribe
-        text = self.transcribe(audio_file)
+        text = self.transcribe(audio)
         
         if text:
             # Output - copy and paste the text
             self.copy_and_paste(text)
             print(f"SUCCESS: {text}", flush=True)
+        elif self.model is None:
+            print("No model available", flush=True)
+            self.notify("Model unavailable")
         else:
             print("No transcription", flush=True)
             self.notify("No speech")
@@ -282,12 +564,34 @@ class FastRecorder:
     
     def cleanup(self):
         """Clean up."""
+        if self.stream:
+            self.stream.close()
         if self.audio:
             self.audio.terminate()
+        if self.x_display:
+            self.x_display.close()
+        if self.dbus:
+            self.dbus.close()
+
+
+def positive_seconds(value):
+    """argparse type for a strictly positive number of seconds."""
+    seconds = float(value)
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return seconds
 
 
 def main():
-    recorder = FastRecorder()
+    parser = argparse.ArgumentParser(description="Fast recorder with whisper.cpp")
+    parser.add_argument(
+        "--auto-stop", type=positive_seconds, metavar="SECONDS",
+        help="stop recording after this many seconds of silence following speech "
+             "(default: record until stopped)"
+    )
+    args = parser.parse_args()
+    
+    recorder = FastRecorder(auto_stop=args.auto_stop)
     try:
         recorder.run()
     finally:
@@ -8,7 +8,7 @@ import sys
 import os
 import time
 import signal
-import wave
+import struct
 import tempfile
 import subprocess
 import threading
@@ -52,7 +52,8 @@ class WorkingRecorder:
         try:
             subprocess.run(
                 ["notify-send", "LinuxST", message, "-t", "2000"],
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
         except:
             pass
@@ -111,11 +112,8 @@ class WorkingRecorder:
                 with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
                     filename = f.name
                 
-                with wave.open(filename, 'wb') as wf:
-                    wf.setnchannels(CHANNELS)
-                    wf.setsampwidth(self.audio.get_sample_size(FORMAT))
-                    wf.setframerate(RATE)
-                    wf.writeframes(b''.join(self.frames))
+                self.write_wav(filename, CHANNELS,
+                               self.audio.get_sample_size(FORMAT), RATE)
                 
                 print(f"Audio saved: {filename}", flush=True)
                 return filename
@@ -124,6 +122,37 @@ class WorkingRecorder:
             print(f"Recording error: {e}", flush=True)
             return None
     
+    def write_wav(self, filename, channels, sample_width, rate):
+        """Write the recorded frames as a PCM WAV file without joining them."""
+        data_size = sum(len(f) for f in self.frames)
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, channels, rate,
+            rate * channels * sample_width, channels * sample_width,
+            sample_width * 8,
+            b'data', data_size
+        )
+        
+        # Scatter-gather write of all chunks, batched to the iovec limit
+        iov_max = os.sysconf('SC_IOV_MAX')
+        if iov_max <= 0:
+            iov_max = 1024
+        buffers = [memoryview(header)] + [memoryview(f) for f in self.frames]
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            i = 0
+            while i < len(buffers):
+                written = os.writev(fd, buffers[i:i + iov_max])
+                # Skip fully written buffers, trim a partially written one
+                while i < len(buffers) and written >= len(buffers[i]):
+                    written -= len(buffers[i])
+                    i += 1
+                if written:
+                    buffers[i] = buffers[i][written:]
+        finally:
+            os.close(fd)
+    
     def transcribe(self, audio_file):
         """Transcribe the audio file."""
         try:
@@ -175,7 +204,8 @@ class WorkingRecorder:
             result = subprocess.run(
                 ["wl-copy"],
                 input=text.encode(),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=1
             )
             if result.returncode == 0:
@@ -194,7 +224,8 @@ class WorkingRecorder:
         if not clipboard_copied:
             try:
                 result = subprocess.run(["xclip", "-selection", "clipboard"], 
-                                      input=text.encode(), capture_output=True, timeout=1)
+                                      input=text.encode(), stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.DEVNULL, timeout=1)
                 if result.returncode == 0:
                     clipboard_copied = True
                     print("Copied via xclip (X11)", flush=True)
@@ -217,7 +248,8 @@ class WorkingRecorder:
             time.sleep(0.5)
             try:
                 result = subprocess.run(["xdotool", "key", "ctrl+v"], 
-                                      capture_output=True, timeout=1)
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.DEVNULL, timeout=1)
                 if result.returncode == 0:
                     paste_success = True
                     print("Auto-pasted with xdotool", flush=True)
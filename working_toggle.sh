@@ -54,8 +54,13 @@ else
     # Start new recording
     cd "$SCRIPT_DIR"
     # Use fast_recorder if available, fall back to working_recorder
+    # Set LINUXST_AUTO_STOP=<seconds> to stop fast_recorder after that much silence
     if [ -f "$SCRIPT_DIR/fast_recorder.py" ]; then
-        python3 "$SCRIPT_DIR/fast_recorder.py" > "$LOG_FILE" 2>&1 &
+        if [ -n "$LINUXST_AUTO_STOP" ]; then
+            python3 "$SCRIPT_DIR/fast_recorder.py" --auto-stop "$LINUXST_AUTO_STOP" > "$LOG_FILE" 2>&1 &
+        else
+            python3 "$SCRIPT_DIR/fast_recorder.py" > "$LOG_FILE" 2>&1 &
+        fi
     else
         python3 "$SCRIPT_DIR/working_recorder.py" > "$LOG_FILE" 2>&1 &
     fi